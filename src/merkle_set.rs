@@ -31,13 +31,16 @@ fn encode_type(t: NodeType) -> u8 {
 }
 
 fn hash(ltype: NodeType, rtype: NodeType, left: &[u8; 32], right: &[u8; 32]) -> [u8; 32] {
+    // the message is 30 zero bytes, the two node types and the two child
+    // hashes. It's assembled in a single stack buffer and passed to the hasher
+    // in one call
+    let mut buf = [0_u8; 96];
+    buf[30] = encode_type(ltype);
+    buf[31] = encode_type(rtype);
+    buf[32..64].copy_from_slice(left);
+    buf[64..].copy_from_slice(right);
     let mut hasher = Sha256::new();
-    hasher.update(&[
-        0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
-    ]);
-    hasher.update(&[encode_type(ltype), encode_type(rtype)]);
-    hasher.update(left);
-    hasher.update(right);
+    hasher.update(&buf);
     hasher.finish()
 }
 
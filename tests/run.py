@@ -4,9 +4,11 @@ from chia_rs import run_chia_program
 
 def run_clvm(fn, env=None):
 
-    program_data = bytes.fromhex(open(fn, 'r').read())
+    with open(fn, 'r') as f:
+        program_data = bytes.fromhex(f.read())
     if env is not None:
-        env_data = bytes.fromhex(open(env, 'r').read())
+        with open(env, 'r') as f:
+            env_data = bytes.fromhex(f.read())
     else:
         env_data = bytes.fromhex("ff80")
     # constants from the main chia blockchain:
@@ -24,14 +26,22 @@ def run_clvm(fn, env=None):
 
 def count_tree_size(tree) -> int:
     stack = [tree]
+    # bind the list methods once, rather than looking them up per node
+    pop = stack.pop
+    push = stack.append
     ret = 0
     while len(stack):
-        i = stack.pop()
-        if i.atom is not None:
-            ret += len(i.atom)
-        elif i.pair is not None:
-            stack.append(i.pair[1])
-            stack.append(i.pair[0])
+        i = pop()
+        # each access to atom or pair creates new python objects, so only
+        # access them once per node
+        atom = i.atom
+        if atom is not None:
+            ret += len(atom)
+            continue
+        pair = i.pair
+        if pair is not None:
+            push(pair[1])
+            push(pair[0])
         else:
             # this shouldn't happen
             assert False
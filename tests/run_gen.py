@@ -5,43 +5,49 @@ from time import time
 from clvm_tools import binutils
 import sys
 
+# the generator ROM from:
+# https://github.com/Chia-Network/chia-blockchain/blob/main/chia/wallet/puzzles/rom_bootstrap_generator.clvm.hex
+GENERATOR_ROM = bytes.fromhex(
+    "ff02ffff01ff02ff0cffff04ff02ffff04ffff02ff05ffff04ff08ffff04ff13"
+    "ff80808080ff80808080ffff04ffff01ffffff02ffff01ff05ffff02ff3effff"
+    "04ff02ffff04ff05ff8080808080ffff04ffff01ffffff81ff7fff81df81bfff"
+    "ffff02ffff03ffff09ff0bffff01818080ffff01ff04ff80ffff04ff05ff8080"
+    "80ffff01ff02ffff03ffff0aff0bff1880ffff01ff02ff1affff04ff02ffff04"
+    "ffff02ffff03ffff0aff0bff1c80ffff01ff02ffff03ffff0aff0bff1480ffff"
+    "01ff0880ffff01ff04ffff0effff18ffff011fff0b80ffff0cff05ff80ffff01"
+    "018080ffff04ffff0cff05ffff010180ff80808080ff0180ffff01ff04ffff18"
+    "ffff013fff0b80ffff04ff05ff80808080ff0180ff80808080ffff01ff04ff0b"
+    "ffff04ff05ff80808080ff018080ff0180ff04ffff0cff15ff80ff0980ffff04"
+    "ffff0cff15ff0980ff808080ffff04ffff04ff05ff1380ffff04ff2bff808080"
+    "ffff02ff16ffff04ff02ffff04ff09ffff04ffff02ff3effff04ff02ffff04ff"
+    "15ff80808080ff8080808080ff02ffff03ffff09ffff0cff05ff80ffff010180"
+    "ff1080ffff01ff02ff2effff04ff02ffff04ffff02ff3effff04ff02ffff04ff"
+    "ff0cff05ffff010180ff80808080ff80808080ffff01ff02ff12ffff04ff02ff"
+    "ff04ffff0cff05ffff010180ffff04ffff0cff05ff80ffff010180ff80808080"
+    "8080ff0180ff018080ff04ffff02ff16ffff04ff02ffff04ff09ff80808080ff"
+    "0d80ffff04ff09ffff04ffff02ff1effff04ff02ffff04ff15ff80808080ffff"
+    "04ff2dffff04ffff02ff15ff5d80ff7d80808080ffff02ffff03ff05ffff01ff"
+    "04ffff02ff0affff04ff02ffff04ff09ff80808080ffff02ff16ffff04ff02ff"
+    "ff04ff0dff8080808080ff8080ff0180ff02ffff03ffff07ff0580ffff01ff0b"
+    "ffff0102ffff02ff1effff04ff02ffff04ff09ff80808080ffff02ff1effff04"
+    "ff02ffff04ff0dff8080808080ffff01ff0bffff0101ff058080ff0180ff0180"
+    "80")
+
 def run_gen(fn, flags=0):
+    with open(fn, "r") as f:
+        env_data = binutils.assemble(f.read()).as_bin()
+    return run_gen_env(env_data, flags)
+
 
-    # the generator ROM from:
-    # https://github.com/Chia-Network/chia-blockchain/blob/main/chia/wallet/puzzles/rom_bootstrap_generator.clvm.hex
-    program_data = bytes.fromhex(
-        "ff02ffff01ff02ff0cffff04ff02ffff04ffff02ff05ffff04ff08ffff04ff13"
-        "ff80808080ff80808080ffff04ffff01ffffff02ffff01ff05ffff02ff3effff"
-        "04ff02ffff04ff05ff8080808080ffff04ffff01ffffff81ff7fff81df81bfff"
-        "ffff02ffff03ffff09ff0bffff01818080ffff01ff04ff80ffff04ff05ff8080"
-        "80ffff01ff02ffff03ffff0aff0bff1880ffff01ff02ff1affff04ff02ffff04"
-        "ffff02ffff03ffff0aff0bff1c80ffff01ff02ffff03ffff0aff0bff1480ffff"
-        "01ff0880ffff01ff04ffff0effff18ffff011fff0b80ffff0cff05ff80ffff01"
-        "018080ffff04ffff0cff05ffff010180ff80808080ff0180ffff01ff04ffff18"
-        "ffff013fff0b80ffff04ff05ff80808080ff0180ff80808080ffff01ff04ff0b"
-        "ffff04ff05ff80808080ff018080ff0180ff04ffff0cff15ff80ff0980ffff04"
-        "ffff0cff15ff0980ff808080ffff04ffff04ff05ff1380ffff04ff2bff808080"
-        "ffff02ff16ffff04ff02ffff04ff09ffff04ffff02ff3effff04ff02ffff04ff"
-        "15ff80808080ff8080808080ff02ffff03ffff09ffff0cff05ff80ffff010180"
-        "ff1080ffff01ff02ff2effff04ff02ffff04ffff02ff3effff04ff02ffff04ff"
-        "ff0cff05ffff010180ff80808080ff80808080ffff01ff02ff12ffff04ff02ff"
-        "ff04ffff0cff05ffff010180ffff04ffff0cff05ff80ffff010180ff80808080"
-        "8080ff0180ff018080ff04ffff02ff16ffff04ff02ffff04ff09ff80808080ff"
-        "0d80ffff04ff09ffff04ffff02ff1effff04ff02ffff04ff15ff80808080ffff"
-        "04ff2dffff04ffff02ff15ff5d80ff7d80808080ffff02ffff03ff05ffff01ff"
-        "04ffff02ff0affff04ff02ffff04ff09ff80808080ffff02ff16ffff04ff02ff"
-        "ff04ff0dff8080808080ff8080ff0180ff02ffff03ffff07ff0580ffff01ff0b"
-        "ffff0102ffff02ff1effff04ff02ffff04ff09ff80808080ffff02ff1effff04"
-        "ff02ffff04ff0dff8080808080ffff01ff0bffff0101ff058080ff0180ff0180"
-        "80")
+# runs an already assembled generator. This lets callers that run the same
+# generator more than once (e.g. with different flags) only assemble it once
+def run_gen_env(env_data, flags=0):
 
     # constants from the main chia blockchain:
     # https://github.com/Chia-Network/chia-blockchain/blob/main/chia/consensus/default_constants.py
     max_cost = 11000000000
     cost_per_byte = 12000
 
-    env_data = binutils.assemble(open(fn, "r").read()).as_bin()
-
     # we don't charge for the size of the generator ROM. However, we do charge
     # cost for the operations it executes
     max_cost -= len(env_data) * cost_per_byte
@@ -52,7 +58,7 @@ def run_gen(fn, flags=0):
 
     try:
         return run_generator(
-            program_data,
+            GENERATOR_ROM,
             env_data,
             max_cost,
             flags,
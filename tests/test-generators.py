@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
-from run_gen import run_gen, print_spend_bundle_conditions
+from run_gen import run_gen_env, print_spend_bundle_conditions
+from clvm_tools import binutils
 from chia_rs import MEMPOOL_MODE
 from time import time
 import sys
@@ -25,52 +26,58 @@ def parse_output(result, error_code) -> str:
 
 for g in sorted(glob.glob('generators/*.clvm')):
     print(f"{g}")
+
+    # the file is read and the generator assembled once, and then run both in
+    # normal and in mempool mode
+    with open(g) as f:
+        contents = f.read()
+    env_data = binutils.assemble(contents).as_bin()
+
     start_time = time()
-    error_code, result = run_gen(g)
+    error_code, result = run_gen_env(env_data)
     run_time = time() - start_time
     output = parse_output(result, error_code)
 
     start_time = time()
-    error_code2, result2 = run_gen(g, MEMPOOL_MODE)
+    error_code2, result2 = run_gen_env(env_data, MEMPOOL_MODE)
     run_time2 = time() - start_time
     output2 = parse_output(result2, error_code2)
 
-    with open(g) as f:
-        expected = f.read().split('\n', 1)[1]
-        if not "STRICT" in expected:
-            expected2 = expected
-            if not (result is None and result2 is None or result.cost == result2.cost):
-                print("cost when running in mempool mode differs from normal mode!")
-                failed = 1
-        else:
-            expected, expected2 = expected.split("STRICT:\n", 1)
-
-        compare_output(output, expected, "")
-        print(f"  run-time: {run_time:.2f}s")
-
-        compare_output(output2, expected2, "STRICT")
-        print(f"  run-time: {run_time2:.2f}s")
-
-        limit = 1.5
-
-        # temporary higher limits until this is optimized
-        if "duplicate-coin-announce.clvm" in g:
-            limit = 9
-        elif "negative-reserve-fee.clvm" in g:
-            limit = 4
-        elif "block-834752" in g:
-            limit = 2
-        elif "block-834760" in g:
-            limit = 10
-        elif "block-834765" in g:
-            limit = 5
-        elif "block-834766" in g:
-            limit = 6
-        elif "block-834768" in g:
-            limit = 6
-
-        if run_time > limit or run_time2 > limit:
-            print("run-time exceeds limit!")
+    expected = contents.split('\n', 1)[1]
+    if not "STRICT" in expected:
+        expected2 = expected
+        if not (result is None and result2 is None or result.cost == result2.cost):
+            print("cost when running in mempool mode differs from normal mode!")
             failed = 1
+    else:
+        expected, expected2 = expected.split("STRICT:\n", 1)
+
+    compare_output(output, expected, "")
+    print(f"  run-time: {run_time:.2f}s")
+
+    compare_output(output2, expected2, "STRICT")
+    print(f"  run-time: {run_time2:.2f}s")
+
+    limit = 1.5
+
+    # temporary higher limits until this is optimized
+    if "duplicate-coin-announce.clvm" in g:
+        limit = 9
+    elif "negative-reserve-fee.clvm" in g:
+        limit = 4
+    elif "block-834752" in g:
+        limit = 2
+    elif "block-834760" in g:
+        limit = 10
+    elif "block-834765" in g:
+        limit = 5
+    elif "block-834766" in g:
+        limit = 6
+    elif "block-834768" in g:
+        limit = 6
+
+    if run_time > limit or run_time2 > limit:
+        print("run-time exceeds limit!")
+        failed = 1
 
 sys.exit(failed)
@@ -6,187 +6,74 @@ import pytest
 parent_coin = b"---foo---                       "
 puzzle_hash = b"---bar---                       "
 puzzle_hash2 = b"---bar--- 2                     "
-
-
-def test_coin_name() -> None:
-
-    c = Coin(parent_coin, puzzle_hash, 0)
-    assert c.name() == sha256(parent_coin + puzzle_hash).digest()
-
-    c = Coin(parent_coin, puzzle_hash, 1)
-    assert c.name() == sha256(parent_coin + puzzle_hash + bytes([1])).digest()
-
-    # 0xFF prefix
-    c = Coin(parent_coin, puzzle_hash, 0xFF)
-    assert c.name() == sha256(parent_coin + puzzle_hash + bytes([0, 0xFF])).digest()
-
-    c = Coin(parent_coin, puzzle_hash, 0xFFFF)
-    assert (
-        c.name() == sha256(parent_coin + puzzle_hash + bytes([0, 0xFF, 0xFF])).digest()
-    )
-
-    c = Coin(parent_coin, puzzle_hash, 0xFFFFFF)
-    assert (
-        c.name()
-        == sha256(parent_coin + puzzle_hash + bytes([0, 0xFF, 0xFF, 0xFF])).digest()
-    )
-
-    c = Coin(parent_coin, puzzle_hash, 0xFFFFFFFF)
-    assert (
-        c.name()
-        == sha256(
-            parent_coin + puzzle_hash + bytes([0, 0xFF, 0xFF, 0xFF, 0xFF])
-        ).digest()
-    )
-
-    c = Coin(parent_coin, puzzle_hash, 0xFFFFFFFFFF)
-    assert (
-        c.name()
-        == sha256(
-            parent_coin + puzzle_hash + bytes([0, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF])
-        ).digest()
-    )
-
-    c = Coin(parent_coin, puzzle_hash, 0xFFFFFFFFFFFF)
-    assert (
-        c.name()
-        == sha256(
-            parent_coin + puzzle_hash + bytes([0, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF])
-        ).digest()
-    )
-
-    c = Coin(parent_coin, puzzle_hash, 0xFFFFFFFFFFFFFF)
-    assert (
-        c.name()
-        == sha256(
-            parent_coin
-            + puzzle_hash
-            + bytes([0, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF])
-        ).digest()
-    )
-
-    c = Coin(parent_coin, puzzle_hash, 0xFFFFFFFFFFFFFFFF)
-    assert (
-        c.name()
-        == sha256(
-            parent_coin
-            + puzzle_hash
-            + bytes([0, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF])
-        ).digest()
-    )
-
-    # 0x7F prefix
-    c = Coin(parent_coin, puzzle_hash, 0x7F)
-    assert c.name() == sha256(parent_coin + puzzle_hash + bytes([0x7F])).digest()
-
-    c = Coin(parent_coin, puzzle_hash, 0x7FFF)
-    assert c.name() == sha256(parent_coin + puzzle_hash + bytes([0x7F, 0xFF])).digest()
-
-    c = Coin(parent_coin, puzzle_hash, 0x7FFFFF)
-    assert (
-        c.name()
-        == sha256(parent_coin + puzzle_hash + bytes([0x7F, 0xFF, 0xFF])).digest()
-    )
-
-    c = Coin(parent_coin, puzzle_hash, 0x7FFFFFFF)
-    assert (
-        c.name()
-        == sha256(parent_coin + puzzle_hash + bytes([0x7F, 0xFF, 0xFF, 0xFF])).digest()
-    )
-
-    c = Coin(parent_coin, puzzle_hash, 0x7FFFFFFFFF)
-    assert (
-        c.name()
-        == sha256(
-            parent_coin + puzzle_hash + bytes([0x7F, 0xFF, 0xFF, 0xFF, 0xFF])
-        ).digest()
-    )
-
-    c = Coin(parent_coin, puzzle_hash, 0x7FFFFFFFFFFF)
-    assert (
-        c.name()
-        == sha256(
-            parent_coin + puzzle_hash + bytes([0x7F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF])
-        ).digest()
-    )
-
-    c = Coin(parent_coin, puzzle_hash, 0x7FFFFFFFFFFFFF)
-    assert (
-        c.name()
-        == sha256(
-            parent_coin
-            + puzzle_hash
-            + bytes([0x7F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF])
-        ).digest()
-    )
-    c = Coin(parent_coin, puzzle_hash, 0x7FFFFFFFFFFFFFFF)
-    assert (
-        c.name()
-        == sha256(
-            parent_coin
-            + puzzle_hash
-            + bytes([0x7F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF])
-        ).digest()
-    )
-
-    # 0x80 prefix
-    c = Coin(parent_coin, puzzle_hash, 0x80)
-    assert c.name() == sha256(parent_coin + puzzle_hash + bytes([0, 0x80])).digest()
-
-    c = Coin(parent_coin, puzzle_hash, 0x8000)
-    assert (
-        c.name() == sha256(parent_coin + puzzle_hash + bytes([0, 0x80, 0])).digest()
-    )
-
-    c = Coin(parent_coin, puzzle_hash, 0x800000)
-    assert (
-        c.name()
-        == sha256(parent_coin + puzzle_hash + bytes([0, 0x80, 0, 0])).digest()
-    )
-
-    c = Coin(parent_coin, puzzle_hash, 0x80000000)
-    assert (
-        c.name()
-        == sha256(
-            parent_coin + puzzle_hash + bytes([0, 0x80, 0, 0, 0])
-        ).digest()
-    )
-
-    c = Coin(parent_coin, puzzle_hash, 0x8000000000)
-    assert (
-        c.name()
-        == sha256(
-            parent_coin + puzzle_hash + bytes([0, 0x80, 0, 0, 0, 0])
-        ).digest()
-    )
-
-    c = Coin(parent_coin, puzzle_hash, 0x800000000000)
-    assert (
-        c.name()
-        == sha256(
-            parent_coin + puzzle_hash + bytes([0, 0x80, 0, 0, 0, 0, 0])
-        ).digest()
-    )
-
-    c = Coin(parent_coin, puzzle_hash, 0x80000000000000)
-    assert (
-        c.name()
-        == sha256(
-            parent_coin
-            + puzzle_hash
-            + bytes([0, 0x80, 0, 0, 0, 0, 0, 0])
-        ).digest()
-    )
-
-    c = Coin(parent_coin, puzzle_hash, 0x8000000000000000)
-    assert (
-        c.name()
-        == sha256(
-            parent_coin
-            + puzzle_hash
-            + bytes([0, 0x80, 0, 0, 0, 0, 0, 0, 0])
-        ).digest()
-    )
+# the part of the coin name preimage that doesn't depend on the amount
+name_prefix = parent_coin + puzzle_hash
+
+
+def amount_suffix(amount: int) -> bytes:
+    # the amount is hashed as its minimal big-endian two's complement
+    # representation, i.e. how it's serialized as a CLVM atom
+    if amount == 0:
+        return b""
+    return amount.to_bytes((amount.bit_length() + 8) // 8, "big")
+
+
+@pytest.mark.parametrize(
+    "amount, suffix",
+    [
+        (0, bytes([])),
+        (1, bytes([1])),
+        # 0xFF prefix
+        (0xFF, bytes([0, 0xFF])),
+        (0xFFFF, bytes([0, 0xFF, 0xFF])),
+        (0xFFFFFF, bytes([0, 0xFF, 0xFF, 0xFF])),
+        (0xFFFFFFFF, bytes([0, 0xFF, 0xFF, 0xFF, 0xFF])),
+        (0xFFFFFFFFFF, bytes([0, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF])),
+        (0xFFFFFFFFFFFF, bytes([0, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF])),
+        (0xFFFFFFFFFFFFFF, bytes([0, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF])),
+        (
+            0xFFFFFFFFFFFFFFFF,
+            bytes([0, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF]),
+        ),
+        # 0x7F prefix
+        (0x7F, bytes([0x7F])),
+        (0x7FFF, bytes([0x7F, 0xFF])),
+        (0x7FFFFF, bytes([0x7F, 0xFF, 0xFF])),
+        (0x7FFFFFFF, bytes([0x7F, 0xFF, 0xFF, 0xFF])),
+        (0x7FFFFFFFFF, bytes([0x7F, 0xFF, 0xFF, 0xFF, 0xFF])),
+        (0x7FFFFFFFFFFF, bytes([0x7F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF])),
+        (0x7FFFFFFFFFFFFF, bytes([0x7F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF])),
+        (0x7FFFFFFFFFFFFFFF, bytes([0x7F, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF])),
+        # 0x80 prefix
+        (0x80, bytes([0, 0x80])),
+        (0x8000, bytes([0, 0x80, 0])),
+        (0x800000, bytes([0, 0x80, 0, 0])),
+        (0x80000000, bytes([0, 0x80, 0, 0, 0])),
+        (0x8000000000, bytes([0, 0x80, 0, 0, 0, 0])),
+        (0x800000000000, bytes([0, 0x80, 0, 0, 0, 0, 0])),
+        (0x80000000000000, bytes([0, 0x80, 0, 0, 0, 0, 0, 0])),
+        (0x8000000000000000, bytes([0, 0x80, 0, 0, 0, 0, 0, 0, 0])),
+    ],
+)
+def test_coin_name(amount: int, suffix: bytes) -> None:
+
+    assert amount_suffix(amount) == suffix
+
+    c = Coin(parent_coin, puzzle_hash, amount)
+    assert c.name() == sha256(name_prefix + suffix).digest()
+
+
+# every amount on either side of a power of two, to cover each transition in
+# the length of the encoding
+@pytest.mark.parametrize(
+    "amount",
+    sorted({a for bit in range(64) for a in (2**bit - 1, 2**bit, 2**bit + 1)})
+    + [0xFFFFFFFFFFFFFFFF],
+)
+def test_coin_name_boundaries(amount: int) -> None:
+
+    c = Coin(parent_coin, puzzle_hash, amount)
+    assert c.name() == sha256(name_prefix + amount_suffix(amount)).digest()
 
 
 def test_coin_copy() -> None:
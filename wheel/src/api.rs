@@ -34,7 +34,10 @@ pub fn compute_merkle_set_root<'p>(
     for b in values {
         buffer.push(b.as_bytes().try_into()?);
     }
-    Ok(PyBytes::new(py, &compute_merkle_root_impl(&mut buffer)))
+    // the leafs have been copied out of the python objects, so computing the
+    // root doesn't need the GIL
+    let root = py.allow_threads(|| compute_merkle_root_impl(&mut buffer));
+    Ok(PyBytes::new(py, &root))
 }
 
 #[pymodule]
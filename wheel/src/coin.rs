@@ -27,30 +27,26 @@ pub struct Coin {
 
 impl Coin {
     fn coin_id(&self) -> [u8; 32] {
-        let mut hasher = Sha256::new();
-        hasher.update(&self.parent_coin_info);
-        hasher.update(&self.puzzle_hash);
+        // the message is at most 32 + 32 + 9 bytes, so it's assembled on the
+        // stack and hashed in a single call
+        let mut buf = [0_u8; 73];
+        buf[..32].copy_from_slice(&self.parent_coin_info);
+        buf[32..64].copy_from_slice(&self.puzzle_hash);
 
-        let amount_bytes = self.amount.to_be_bytes();
-        if self.amount >= 0x8000000000000000_u64 {
-            hasher.update(&[0_u8]);
-            hasher.update(&amount_bytes);
+        // the amount is hashed as its minimal big-endian two's complement
+        // representation. That's the significant bits plus a sign bit,
+        // rounded up to whole bytes. The extra leading byte covers amounts
+        // with the most significant bit set. Zero is the empty atom
+        let mut amount_bytes = [0_u8; 9];
+        amount_bytes[1..].copy_from_slice(&self.amount.to_be_bytes());
+        let num_bytes = if self.amount == 0 {
+            0
         } else {
-            let start = match self.amount {
-                n if n >= 0x80000000000000_u64 => 0,
-                n if n >= 0x800000000000_u64 => 1,
-                n if n >= 0x8000000000_u64 => 2,
-                n if n >= 0x80000000_u64 => 3,
-                n if n >= 0x800000_u64 => 4,
-                n if n >= 0x8000_u64 => 5,
-                n if n >= 0x80_u64 => 6,
-                n if n > 0 => 7,
-                _ => 8,
-            };
-            hasher.update(&amount_bytes[start..]);
-        }
+            (72 - self.amount.leading_zeros() as usize) / 8
+        };
+        buf[64..64 + num_bytes].copy_from_slice(&amount_bytes[9 - num_bytes..]);
 
-        hasher.finalize().into()
+        Sha256::digest(&buf[..64 + num_bytes]).into()
     }
 }
 
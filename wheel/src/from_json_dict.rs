@@ -21,6 +21,16 @@ impl<const N: usize> FromJsonDict for BytesImpl<N> {
             ));
         }
         let s = &s[2..];
+        // the common case, where the string has the expected length, is
+        // decoded straight into the fixed size array. Any other length is an
+        // error, but we still decode it to report the number of bytes
+        if s.len() == N * 2 {
+            let mut buf = [0_u8; N];
+            if hex::decode_to_slice(s, &mut buf).is_err() {
+                return Err(PyValueError::new_err("invalid hex"));
+            }
+            return Ok(buf.into());
+        }
         let buf = match Vec::from_hex(s) {
             Err(_) => {
                 return Err(PyValueError::new_err("invalid hex"));
@@ -6,6 +6,16 @@ pub trait ToJsonDict {
     fn to_json_dict(&self, py: Python) -> PyResult<PyObject>;
 }
 
+// bytes are represented as a 0x-prefixed hex string. The string is encoded
+// straight into its final buffer, rather than going through hex::encode()
+// and then format!(), which allocates and copies it twice
+fn hex_string(bytes: &[u8]) -> String {
+    let mut buf = vec![0_u8; 2 + bytes.len() * 2];
+    buf[..2].copy_from_slice(b"0x");
+    hex::encode_to_slice(bytes, &mut buf[2..]).unwrap();
+    String::from_utf8(buf).unwrap()
+}
+
 impl ToJsonDict for u32 {
     fn to_json_dict(&self, py: Python) -> PyResult<PyObject> {
         Ok(self.to_object(py))
@@ -20,13 +30,13 @@ impl ToJsonDict for u64 {
 
 impl<const N: usize> ToJsonDict for BytesImpl<N> {
     fn to_json_dict(&self, py: Python) -> PyResult<PyObject> {
-        Ok(format!("0x{}", self).to_object(py))
+        Ok(hex_string(self.as_ref()).to_object(py))
     }
 }
 
 impl ToJsonDict for Bytes {
     fn to_json_dict(&self, py: Python) -> PyResult<PyObject> {
-        Ok(format!("0x{}", self).to_object(py))
+        Ok(hex_string(self.as_ref()).to_object(py))
     }
 }
 